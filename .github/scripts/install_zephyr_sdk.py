@@ -8,62 +8,418 @@ If it is empty or unset, the script falls back to the latest release.
 
 from __future__ import annotations
 
+import base64
+import codecs
+import contextlib
+import hashlib
+import http.client
+import io
 import json
+import lzma
+import mmap
 import os
+import re
 import shutil
+import ssl
 import subprocess
 import sys
 import tarfile
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from pathlib import Path
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 
 REPO_RELEASES = "https://api.github.com/repos/zephyrproject-rtos/sdk-ng/releases"
+DOWNLOAD_BASE = "https://github.com/zephyrproject-rtos/sdk-ng/releases/download"
+
+# Pinned releases never change; "latest" moves, so it is only trusted briefly.
+PINNED_RELEASE_TTL = 30 * 24 * 3600
+LATEST_RELEASE_TTL = 3600
+
+# Chunk size for network -> disk/pipe copies; large enough to keep Python out of the loop.
+COPY_BUFFER_SIZE = 4 << 20
+
+# Parallel ranged downloads: number of segments and the smallest file worth splitting.
+DOWNLOAD_SEGMENTS = 8
+MIN_SEGMENTED_SIZE = 64 << 20
+
+# Pure-Python extraction fallback: writer threads and decompressed read-ahead.
+EXTRACT_WORKERS = 32
+DECOMPRESS_BUFFER_SIZE = 8 << 20
+# Larger members are written inline, so queued writes hold at most EXTRACT_WORKERS * 4 MiB.
+INLINE_WRITE_SIZE = 1 << 20
+
+# Linux x86_64 SDK installers: "<ver>_linux-x86_64[_minimal].tar.xz" since 0.14,
+# "<ver>-linux-x86_64-setup.run" in 0.13 and "<ver>-x86_64-linux-setup.run" in 0.12.
+# <ver> may carry a pre-release suffix (e.g. "0.16.0-rc1"). Host-tools bundles and
+# the per-architecture zephyr-toolchain-* installers deliberately do not match.
+_ASSET_RE = re.compile(
+    r"zephyr-sdk-(?!.*hosttools)[\w.+-]+?[_-](?:linux-x86_64|x86_64-linux)(_minimal)?(?:-setup)?"
+    r"\.(run|tar\.xz)"
+)
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that resumes an earlier TLS session with the same host."""
+
+    def __init__(self, *args, tls_session: Optional[ssl.SSLSession] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.tls_session = tls_session
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)  # also issues CONNECT when tunnelling
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=self._tunnel_host or self.host, session=self.tls_session
+        )
+
+
+class _Session:
+    """Tiny keep-alive HTTP client that pools connections per host.
+
+    ``urllib.request`` sends ``Connection: close`` and opens a fresh TCP/TLS
+    connection for every request, including each redirect hop. Pooling lets the
+    API call, the asset redirect and the CDN download reuse connections, and
+    extra connections to a host (parallel ranges) resume its TLS session
+    instead of doing a full handshake. Proxies are taken from the environment
+    (``https_proxy``, ``no_proxy``...) the same way ``urlopen`` does.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 8,
+        retries: int = 5,
+        backoff_factor: float = 0.5,
+        connect_timeout: float = 5,
+        read_timeout: float = 60,
+        max_redirects: int = 10,
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_redirects = max_redirects
+        self._context = ssl.create_default_context()
+        self._pool: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._tls_sessions: Dict[str, ssl.SSLSession] = {}
+        self._proxies = urllib.request.getproxies()
+        self._lock = threading.Lock()
+
+    def _proxy_for(self, scheme: str, netloc: str) -> Optional[urllib.parse.SplitResult]:
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(netloc):
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        return urllib.parse.urlsplit(proxy)
+
+    @staticmethod
+    def _proxy_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+        if not proxy.username:
+            return {}
+        credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        return {"Proxy-Authorization": f"Basic {base64.b64encode(credentials.encode()).decode('ascii')}"}
+
+    def _acquire(
+        self, scheme: str, netloc: str, proxy: Optional[urllib.parse.SplitResult]
+    ) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._pool.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+            tls_session = self._tls_sessions.get(netloc)
+        address = proxy.netloc.rpartition("@")[2] if proxy else netloc
+        if scheme == "https":
+            conn = _HTTPSConnection(
+                address, timeout=self.connect_timeout, context=self._context, tls_session=tls_session
+            )
+            if proxy:
+                conn.set_tunnel(netloc, headers=self._proxy_headers(proxy))
+            return conn
+        return http.client.HTTPConnection(address, timeout=self.connect_timeout)
+
+    def _release(
+        self, key: Tuple[str, str], conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        if not response.isclosed() and response.length == 0:
+            response.read()  # bodiless responses (HEAD, 304) still need closing
+        if response.isclosed() and not response.will_close:
+            with self._lock:
+                idle = self._pool.setdefault(key, [])
+                if len(idle) < self.pool_maxsize:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _send(
+        self, method: str, url: str, headers: Dict[str, str]
+    ) -> Tuple[Tuple[str, str], http.client.HTTPConnection, http.client.HTTPResponse]:
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        proxy = self._proxy_for(*key)
+        if proxy and parts.scheme == "http":
+            # Plain HTTP goes through the proxy as an absolute-form request, not a tunnel.
+            target = f"{parts.scheme}://{parts.netloc}{target}"
+            headers = {**headers, **self._proxy_headers(proxy)}
+        for attempt in range(self.retries + 1):
+            conn = self._acquire(*key, proxy)
+            try:
+                if conn.sock is None:
+                    # Connect (and tunnel) under the short timeout so an unreachable host
+                    # fails fast, then give the established socket the longer read timeout.
+                    conn.connect()
+                    conn.sock.settimeout(self.read_timeout)
+                conn.request(method, target, headers=headers)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException):
+                # Pooled connections may have been dropped by the server; retry on a new one.
+                conn.close()
+                if attempt == self.retries:
+                    raise
+            else:
+                # Taken after the response headers, so TLS 1.3 session tickets have arrived.
+                sock = conn.sock
+                if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+                    with self._lock:
+                        self._tls_sessions[key[1]] = sock.session
+                if response.status not in _RETRY_STATUSES or attempt == self.retries:
+                    return key, conn, response
+                response.read()
+                self._release(key, conn, response)
+            time.sleep(self.backoff_factor * (2 ** attempt))
+        raise AssertionError("unreachable")
+
+    @contextlib.contextmanager
+    def open(
+        self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[http.client.HTTPResponse]:
+        """Send a request, following redirects, and yield the final response.
+
+        Raises ``urllib.error.HTTPError`` for 4xx/5xx answers so callers can keep
+        treating failures the same way they did with ``urlopen``.
+        """
+        headers = dict(headers or {})
+        for _ in range(self.max_redirects + 1):
+            key, conn, response = self._send(method, url, headers)
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            response.read()
+            self._release(key, conn, response)
+            target = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(target).netloc != key[1]:
+                headers.pop("Authorization", None)
+            url = target
+        else:
+            self._release(key, conn, response)
+            raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+        try:
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            response.url = url
+            yield response
+        finally:
+            self._release(key, conn, response)
+
+
+_SESSION = _Session()
+
+
+def _cache_path(version: str) -> Path:
+    """Where release metadata is cached between runs.
+
+    Actions empties $RUNNER_TEMP at every job boundary, so the metadata sits in the
+    tool cache instead: it persists on self-hosted runners and the workflow's
+    actions/cache step carries it across hosted ones. Local runs use /tmp.
+    """
+    tool_cache = os.environ.get("RUNNER_TOOL_CACHE")
+    cache_dir = Path(tool_cache) / "zephyr-sdk" / "releases" if tool_cache else Path("/tmp")
+    return cache_dir / f"zsdk-release-{version or 'latest'}.json"
+
+
+def _load_cached_release(path: Path) -> Tuple[Optional[Dict], float]:
+    """Return the cached release and its age in seconds, or (None, inf)."""
+    try:
+        age = time.time() - path.stat().st_mtime
+        return json.loads(path.read_text(encoding="utf-8")), age
+    except (OSError, ValueError):
+        return None, float("inf")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+def _store_cached_release(path: Path, release: Dict, etag: Optional[str]) -> None:
+    # The body is written before its ETag so a stale .etag can never vouch for newer JSON.
+    etag_path = path.with_suffix(".etag")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, json.dumps(release))
+        if etag:
+            _write_atomic(etag_path, etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+    except OSError as exc:
+        print(f"Warning: could not cache release metadata at {path}: {exc}")
+
+
+_JSON_WHITESPACE = re.compile(r"\s*")
+
+
+class _JSONStream:
+    """Decode a JSON document value by value as it arrives, without reading all of it."""
+
+    def __init__(self, source: BinaryIO) -> None:
+        self.source = source
+        self.text = ""
+        self.pos = 0
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        chunk = self.source.read(64 << 10)
+        if not chunk:
+            return False
+        self.text = self.text[self.pos :] + self._utf8.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def punct(self) -> str:
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Inside an object or array every value is followed by a delimiter; without
+            # one in the buffer the value (e.g. a number split mid-digits) may continue.
+            follow = _JSON_WHITESPACE.match(self.text, end).end()
+            if (follow == len(self.text) or self.text[follow] not in ",:]}") and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _read_assets(source: BinaryIO) -> List[Dict]:
+    """Parse only the "assets" array of a release object.
+
+    Reading stops at the end of the array, so the release notes and any other
+    trailing fields are neither downloaded in full nor materialized.
+    """
+    stream = _JSONStream(source)
+    if stream.punct() != "{":
+        raise ValueError("Release metadata is not a JSON object")
+    if stream.peek() == "}":
+        return []
+    while True:
+        key = stream.value()
+        if stream.punct() != ":":
+            raise ValueError("Malformed release metadata")
+        if key == "assets":
+            break
+        stream.value()
+        if stream.punct() == "}":
+            return []
+
+    assets: List[Dict] = []
+    if stream.punct() != "[":
+        raise ValueError("Release assets are not a JSON array")
+    if stream.peek() == "]":
+        return assets
+    while True:
+        assets.append(stream.value())
+        if stream.punct() == "]":
+            return assets
 
 
 def resolve_release(version: Optional[str]) -> Dict:
-    """Fetch the release metadata for a specific version or the latest release."""
+    """Fetch the release metadata for a specific version or the latest release.
+
+    Only the asset list is parsed and kept. Responses are cached on disk so
+    reruns skip the API round-trip; once the cache goes stale it is revalidated
+    with its ETag.
+    """
     version = (version or "").strip()
+    cache_path = _cache_path(version)
+    cached, age = _load_cached_release(cache_path)
+    if cached is not None and age <= (PINNED_RELEASE_TTL if version else LATEST_RELEASE_TTL):
+        print(f"Using cached release metadata from {cache_path}")
+        return cached
+
     url = f"{REPO_RELEASES}/tags/v{version}" if version else f"{REPO_RELEASES}/latest"
     token = os.environ.get("GITHUB_TOKEN", "").strip()
     headers = {"Accept": "application/vnd.github+json", "User-Agent": "zephyr-ci-cd"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
+    if cached is not None:
+        with contextlib.suppress(OSError):
+            etag = cache_path.with_suffix(".etag").read_text(encoding="utf-8").strip()
+            if etag:
+                headers["If-None-Match"] = etag
     try:
-        request = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(request) as response:
-            return json.load(response)
+        with _SESSION.open(url, headers=headers) as response:
+            if response.status == 304:
+                print(f"Release metadata not modified; reusing {cache_path}")
+                with contextlib.suppress(OSError):
+                    cache_path.touch()
+                return cached
+            release = {"assets": _read_assets(response)}
+            etag = response.getheader("ETag")
     except urllib.error.HTTPError as exc:
         raise SystemExit(f"Failed to fetch SDK release metadata from {url}: {exc}") from exc
+    except ValueError as exc:
+        raise SystemExit(f"Malformed SDK release metadata from {url}: {exc}") from exc
+    _store_cached_release(cache_path, release, etag)
+    return release
 
 
 def pick_installer_asset(release: Dict) -> Tuple[Dict, str]:
     """Pick the best available Linux installer asset. Returns the asset and type."""
     assets = release.get("assets", []) or []
+    best: Optional[Tuple[int, Dict]] = None
+    for asset in assets:
+        match = _ASSET_RE.fullmatch(asset.get("name", ""))
+        if not match:
+            continue
+        if match.group(2) == "run":
+            return asset, "run"
+        priority = 2 if match.group(1) else 1
+        if best is None or priority < best[0]:
+            best = (priority, asset)
 
-    def filtered(predicate):
-        return [asset for asset in assets if predicate(asset)]
-
-    run_assets = filtered(
-        lambda asset: asset.get("name", "").endswith(".run")
-        and "linux" in asset.get("name", "").lower()
-        and "x86_64" in asset.get("name", "").lower()
-        and "hosttools" not in asset.get("name", "").lower()
-    )
-    if run_assets:
-        return run_assets[0], "run"
-
-    tar_assets = filtered(
-        lambda asset: asset.get("name", "").endswith(".tar.xz")
-        and "linux" in asset.get("name", "").lower()
-        and "x86_64" in asset.get("name", "").lower()
-    )
-    if tar_assets:
-        preferred = [a for a in tar_assets if "minimal" not in a.get("name", "").lower()]
-        asset = preferred[0] if preferred else tar_assets[0]
-        return asset, "tar"
+    if best is not None:
+        return best[1], "tar"
 
     asset_names = ", ".join(a.get("name", "<unknown>") for a in assets) or "<no assets>"
     raise SystemExit(
@@ -71,65 +427,418 @@ def pick_installer_asset(release: Dict) -> Tuple[Dict, str]:
     )
 
 
+def _probe(url: str) -> Tuple[str, Optional[int], bool]:
+    """HEAD the URL. Returns the post-redirect URL, its size and range support."""
+    with _SESSION.open(url, method="HEAD") as response:
+        length = response.getheader("Content-Length", "")
+        accepts_ranges = response.getheader("Accept-Ranges", "").lower() == "bytes"
+        return response.url, int(length) if length.isdigit() else None, accepts_ranges
+
+
+def _predicted_asset_url(version: str) -> str:
+    """URL of the full Linux tarball that sdk-ng publishes for every release."""
+    return f"{DOWNLOAD_BASE}/v{version}/zephyr-sdk-{version}_linux-x86_64.tar.xz"
+
+
+def _pinned_release(version: str) -> Dict:
+    """Release metadata for a pinned version, built from sdk-ng's fixed asset names."""
+    tarball_url = _predicted_asset_url(version)
+    return {
+        "assets": [
+            {"name": tarball_url.rsplit("/", 1)[1], "browser_download_url": tarball_url},
+            {"name": "sha256.sum", "browser_download_url": f"{DOWNLOAD_BASE}/v{version}/sha256.sum"},
+        ]
+    }
+
+
+def _resolve_redirect(url: str) -> Optional[str]:
+    """Follow the release-asset redirect ahead of time; None if the probe fails."""
+    try:
+        return _probe(url)[0]
+    except (OSError, http.client.HTTPException):
+        return None
+
+
+def _download_range(url: str, fd: int, start: int, end: int) -> bool:
+    """Write bytes [start, end] of the URL at the same offset in fd."""
+    with _SESSION.open(url, headers={"Range": f"bytes={start}-{end}"}) as response:
+        if response.status != 206:
+            return False
+        offset = start
+        while True:
+            chunk = response.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+    if offset != end + 1:
+        raise SystemExit(f"Short read for bytes {start}-{end} of {url}")
+    return True
+
+
+def _open_for_write(destination: Path) -> int:
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return fd
+
+
+def _download_segmented(url: str, destination: Path, size: int) -> bool:
+    fd = _open_for_write(destination)
+    try:
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except (AttributeError, OSError):
+            os.ftruncate(fd, size)
+        step = -(-size // DOWNLOAD_SEGMENTS)
+        ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            results = list(pool.map(lambda bounds: _download_range(url, fd, *bounds), ranges))
+    finally:
+        os.close(fd)
+    return all(results)
+
+
 def download(url: str, destination: Path) -> None:
-    """Stream the remote file to disk."""
-    with urllib.request.urlopen(url) as source, destination.open("wb") as target:
-        shutil.copyfileobj(source, target)
+    """Download the remote file to disk, in parallel byte ranges when the server allows it."""
+    try:
+        url, size, accepts_ranges = _probe(url)
+    except urllib.error.HTTPError as exc:
+        print(f"HEAD {url} failed ({exc}); downloading as a single stream.")
+    else:
+        if accepts_ranges and size and size >= MIN_SEGMENTED_SIZE:
+            if _download_segmented(url, destination, size):
+                return
+            print("Server ignored range requests; downloading as a single stream.")
+
+    with _SESSION.open(url) as source, open(_open_for_write(destination), "wb", buffering=0) as target:
+        shutil.copyfileobj(source, target, length=COPY_BUFFER_SIZE)
+
+
+def _expected_sha256(release: Dict, asset: Dict) -> Optional[str]:
+    """Look up the published SHA-256 of an asset.
+
+    GitHub reports a ``digest`` for newer uploads; older sdk-ng releases only
+    ship a ``sha256.sum`` asset listing every file.
+    """
+    algorithm, _, value = (asset.get("digest") or "").partition(":")
+    if algorithm == "sha256" and value:
+        return value.lower()
+    for candidate in release.get("assets", []) or []:
+        if candidate.get("name") != "sha256.sum":
+            continue
+        try:
+            with _SESSION.open(candidate["browser_download_url"]) as response:
+                listing = response.read().decode("utf-8", "replace")
+        except (OSError, http.client.HTTPException) as exc:
+            print(f"Warning: could not fetch {candidate['browser_download_url']}: {exc}")
+            return None
+        for line in listing.splitlines():
+            fields = line.split()
+            if len(fields) == 2 and fields[1].lstrip("*") == asset["name"]:
+                return fields[0].lower()
+    return None
+
+
+def _check_digest(name: str, actual: str, expected: Optional[str]) -> None:
+    if expected is None:
+        print(f"No published SHA-256 for {name}; skipping verification.")
+    elif actual != expected:
+        raise SystemExit(f"SHA-256 mismatch for {name}: expected {expected}, got {actual}")
+    else:
+        print(f"Verified SHA-256 of {name}")
+
+
+def verify(path: Path, expected_sha256: Optional[str]) -> None:
+    """Hash the downloaded file in one sequential pass and compare it to the release digest."""
+    if expected_sha256 is None:
+        _check_digest(path.name, "", None)
+        return
+    with path.open("rb") as source:
+        if hasattr(hashlib, "file_digest"):
+            actual = hashlib.file_digest(source, "sha256").hexdigest()
+        else:
+            digest = hashlib.sha256()
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    for offset in range(0, len(view), COPY_BUFFER_SIZE):
+                        digest.update(view[offset : offset + COPY_BUFFER_SIZE])
+            actual = digest.hexdigest()
+    _check_digest(path.name, actual, expected_sha256)
+
+
+class _HashingReader:
+    """Read-through wrapper that hashes a stream as it is consumed."""
+
+    def __init__(self, source: BinaryIO) -> None:
+        self.source = source
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.source.read(size)
+        self.digest.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        # Extractors may stop at the end-of-archive marker; hash any trailing padding too.
+        while self.read(COPY_BUFFER_SIZE):
+            pass
+        return self.digest.hexdigest()
 
 
 def install_from_run(installer_path: Path, sdk_dir: Path) -> Path:
-    installer_path.chmod(installer_path.stat().st_mode | stat.S_IEXEC)
+    os.chmod(installer_path, 0o755)
     subprocess.run([str(installer_path), "--", "-d", str(sdk_dir)], check=True)
     return sdk_dir
 
 
-def install_from_tarball(archive_path: Path, version: str) -> Path:
-    home = Path.home()
-    print(f"Extracting {archive_path} into {home}")
-    with tarfile.open(archive_path) as tar:
-        tar.extractall(path=home)
+def _extract_with_tar(archive: BinaryIO, command: List[str]) -> None:
+    """Pipe the archive into an external tar so extraction overlaps with the download."""
+    proc = subprocess.Popen(command, stdin=subprocess.PIPE)
+    try:
+        shutil.copyfileobj(archive, proc.stdin, length=COPY_BUFFER_SIZE)
+    except BrokenPipeError:
+        pass  # tar exited early; its exit status is reported below
+    except BaseException:
+        proc.kill()
+        raise
+    finally:
+        with contextlib.suppress(BrokenPipeError):
+            proc.stdin.close()
+        proc.wait()
+    if proc.returncode:
+        raise SystemExit(f"{command[0]} exited with status {proc.returncode} while extracting the SDK.")
+
+
+def _tar_command(tar_bin: str, home: Path) -> List[str]:
+    """Build the tar invocation, using a multi-threaded xz decoder when one is installed."""
+    # Like the Python fallback, skip per-file utime()/chown() calls the SDK does not need.
+    command = [tar_bin, "-x", "-f", "-", "-C", str(home), "-m", "--no-same-owner"]
+    if shutil.which("xz"):
+        # xz >= 5.4 decodes multi-block archives on all cores; older releases ignore -T.
+        return command + ["--use-compress-program=xz -T0"]
+    return command + ["-J"]
+
+
+def _write_member(destination: Path, data: bytes, mode: int) -> None:
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with open(fd, "wb") as target:
+        target.write(data)
 
-    candidates = []
+
+def _ensure_dir(directory: Path, seen_dirs: Set[Path]) -> None:
+    """mkdir -p once per directory; seen_dirs must already contain the extraction root."""
+    if directory in seen_dirs:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    # mkdir(parents=True) also created every missing ancestor, so none needs another call.
+    while directory not in seen_dirs:
+        seen_dirs.add(directory)
+        directory = directory.parent
+
+
+def _extract_with_tarfile(archive: BinaryIO, home: Path) -> None:
+    """Extract in-process, handing file writes to a thread pool.
+
+    Only permission bits are restored (the SDK ships executables); mtimes and
+    ownership are skipped. Links are created last, once their targets exist.
+    Only files under INLINE_WRITE_SIZE are buffered for the pool; larger ones are
+    streamed to disk inline, which keeps the memory held by queued writes bounded.
+    """
+    seen_dirs = {home}
+    deferred = []
+    pending = []
+    slots = threading.BoundedSemaphore(EXTRACT_WORKERS * 4)
+    # Decode xz separately behind a large buffer so tarfile's many small reads stay cheap.
+    decompressed = io.BufferedReader(lzma.LZMAFile(archive), buffer_size=DECOMPRESS_BUFFER_SIZE)
+    with decompressed, tarfile.open(fileobj=decompressed, mode="r|") as tar, ThreadPoolExecutor(
+        max_workers=EXTRACT_WORKERS
+    ) as pool:
+        for member in tar:
+            name = PurePosixPath(member.name)
+            if name.is_absolute() or ".." in name.parts:
+                raise SystemExit(f"Refusing to extract unsafe path {member.name!r}")
+            destination = home / name
+            if member.isdir():
+                _ensure_dir(destination, seen_dirs)
+            elif member.isfile():
+                _ensure_dir(destination.parent, seen_dirs)
+                if member.size >= INLINE_WRITE_SIZE:
+                    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, member.mode & 0o7777)
+                    with open(fd, "wb") as target:
+                        shutil.copyfileobj(tar.extractfile(member), target, COPY_BUFFER_SIZE)
+                    continue
+                data = tar.extractfile(member).read()
+                slots.acquire()
+                future = pool.submit(_write_member, destination, data, member.mode & 0o7777)
+                future.add_done_callback(lambda _: slots.release())
+                pending.append(future)
+            else:
+                deferred.append(member)
+        for future in pending:
+            future.result()
+        # The "data" filter (where this Python has it) rejects links pointing outside home.
+        extract_args = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        for member in deferred:
+            tar.extract(member, path=home, **extract_args)
+
+
+def _candidate_dirs(home: Path, archive_name: str, version: str) -> Iterator[Path]:
+    """Yield the likely SDK directory names, most specific first."""
     version = (version or "").strip()
     if version:
-        candidates.append(home / f"zephyr-sdk-{version}")
+        yield home / f"zephyr-sdk-{version}"
 
-    base_name = archive_path.name.replace(".tar.xz", "")
+    base_name = archive_name.replace(".tar.xz", "")
     # Strip platform suffix (e.g., _linux-x86_64 or _linux-x86_64_minimal)
     if "_linux" in base_name:
-        candidates.append(home / base_name.split("_linux", 1)[0])
-    candidates.append(home / base_name)
+        yield home / base_name.split("_linux", 1)[0]
+    yield home / base_name
 
-    for candidate in candidates:
+
+def install_from_tarball(
+    archive: BinaryIO, archive_name: str, version: str, home: Optional[Path] = None
+) -> Path:
+    """Extract a .tar.xz stream into home ($HOME by default) and return the SDK directory it created."""
+    home = home or Path.home()
+    print(f"Extracting {archive_name} into {home}")
+    tar_bin = shutil.which("tar")
+    if tar_bin:
+        _extract_with_tar(archive, _tar_command(tar_bin, home))
+    else:
+        _extract_with_tarfile(archive, home)
+
+    for candidate in _candidate_dirs(home, archive_name, version):
         if candidate.exists():
             return candidate
 
-    extracted = sorted(home.glob("zephyr-sdk-*"), key=lambda p: p.stat().st_mtime, reverse=True)
+    # DirEntry.is_dir() comes from the directory read itself, so only matches get stat()ed.
+    with os.scandir(home) as entries:
+        extracted = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in entries
+            if entry.name.startswith("zephyr-sdk-") and entry.is_dir()
+        ]
     if extracted:
-        return extracted[0]
+        return Path(max(extracted)[1])
 
     raise SystemExit("Failed to locate extracted Zephyr SDK directory after unpacking tarball.")
 
 
-def main() -> None:
-    version = os.environ.get("ZSDK_VERSION", "")
-    release = resolve_release(version)
+def _select_asset(version: str) -> Tuple[Dict, Dict, str, str]:
+    """Find the installer to use. Returns the release, the asset, its type and the URL to fetch."""
+    # A pinned version's tarball lives at a predictable URL; when it is there the
+    # API call is skipped and the download starts from the resolved CDN location.
+    resolved_url = _resolve_redirect(_predicted_asset_url(version)) if version else None
+    if resolved_url:
+        print(f"Found the Zephyr SDK {version} tarball at its release URL; skipping the API lookup.")
+        release = _pinned_release(version)
+    else:
+        release = resolve_release(version)
     asset, asset_type = pick_installer_asset(release)
-    download_url = asset["browser_download_url"]
+    download_url = resolved_url or asset["browser_download_url"]
+    return release, asset, asset_type, download_url
 
-    workspace = Path.cwd()
-    artifact_path = workspace / asset["name"]
-    print(f"Downloading {download_url} -> {artifact_path}")
-    download(download_url, artifact_path)
 
-    sdk_dir = Path(os.environ["HOME"]) / "zephyr-sdk"
-    if asset_type == "run":
-        print(f"Installing Zephyr SDK via installer into {sdk_dir}")
-        install_from_run(artifact_path, sdk_dir)
-    else:
+def _install_sdk(
+    selection: Tuple[Dict, Dict, str, str], version: str, sdk_dir: Path, extract_root: Path
+) -> Path:
+    """Download and install the selected asset. A .run installs into sdk_dir, a tarball under extract_root."""
+    release, asset, asset_type, download_url = selection
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # The checksum lookup may need its own request; overlap it with the download.
+        expected_sha256 = pool.submit(_expected_sha256, release, asset)
+        if asset_type == "run":
+            artifact_path = Path.cwd() / asset["name"]
+            print(f"Downloading {download_url} -> {artifact_path}")
+            download(download_url, artifact_path)
+            verify(artifact_path, expected_sha256.result())
+            if sdk_dir.is_symlink():
+                sdk_dir.unlink()  # a link into the tool cache from an earlier tarball install
+            print(f"Installing Zephyr SDK via installer into {sdk_dir}")
+            return install_from_run(artifact_path, sdk_dir)
+
         print("Installer (.run) not available, falling back to tarball extraction.")
-        sdk_dir = install_from_tarball(artifact_path, version)
+        print(f"Streaming {download_url} into the extractor")
+        with _SESSION.open(download_url) as response:
+            reader = _HashingReader(response)
+            sdk_dir = install_from_tarball(reader, asset["name"], version, extract_root)
+            try:
+                _check_digest(asset["name"], reader.hexdigest(), expected_sha256.result())
+            except SystemExit:
+                # The stream was extracted before it could be verified; don't leave it behind.
+                shutil.rmtree(sdk_dir, ignore_errors=True)
+                print(f"Removed {sdk_dir}, which was extracted from the unverified tarball.")
+                raise
         print(f"Tarball extracted to {sdk_dir}")
+        return sdk_dir
+
+
+def _link_sdk(target: Path, link: Path) -> Path:
+    """Point link at target. Returns the path to record, which is target if linking fails."""
+    tmp = link.with_name(f"{link.name}.{os.getpid()}.tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        tmp.symlink_to(target, target_is_directory=True)
+        os.replace(tmp, link)
+    except OSError as exc:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
+        print(f"Could not link {link} -> {target} ({exc}); using {target} directly.")
+        return target
+    print(f"Linked {link} -> {target}")
+    return link
+
+
+def _install_cached(version: str, sdk_dir: Path) -> Path:
+    """Install a pinned SDK once into the runner tool cache and link sdk_dir to it."""
+    cache_dir = Path(os.environ.get("RUNNER_TOOL_CACHE", "/opt/hostedtoolcache")) / "zephyr-sdk" / version
+    if (cache_dir / ".ok").exists():
+        print(f"Using cached Zephyr SDK {version} from {cache_dir}")
+        return _link_sdk(cache_dir, sdk_dir)
+
+    selection = _select_asset(version)
+    if selection[2] == "run":
+        # The .run installer's relocation step writes its install directory into the host
+        # tools and the CMake package registry, so it cannot be staged and renamed afterwards.
+        print("The .run installer is not relocatable; installing without the tool cache.")
+        return _install_sdk(selection, version, sdk_dir, Path.home())
+
+    # Per-process staging, so concurrent jobs sharing a tool cache never clobber each other.
+    staging = cache_dir.with_name(f"{version}.{os.getpid()}.partial")
+    try:
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+    except OSError as exc:
+        print(f"Tool cache {cache_dir.parent} is not usable ({exc}); installing without it.")
+        return _install_sdk(selection, version, sdk_dir, Path.home())
+
+    try:
+        installed = _install_sdk(selection, version, staging, staging)
+        (installed / ".ok").touch()
+        try:
+            os.rename(installed, cache_dir)
+        except OSError:
+            if (cache_dir / ".ok").exists():
+                print(f"Another job already cached Zephyr SDK {version}; using {cache_dir}")
+                return _link_sdk(cache_dir, sdk_dir)
+            # Without .ok, cache_dir is a leftover from an interrupted run.
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            os.rename(installed, cache_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return _link_sdk(cache_dir, sdk_dir)
+
+
+def main() -> None:
+    version = os.environ.get("ZSDK_VERSION", "").strip()
+    sdk_dir = Path(os.environ["HOME"]) / "zephyr-sdk"
+    if version:
+        sdk_dir = _install_cached(version, sdk_dir)
+    else:
+        sdk_dir = _install_sdk(_select_asset(version), version, sdk_dir, Path.home())
 
     github_env = os.environ.get("GITHUB_ENV")
     if not github_env: